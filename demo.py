@@ -8,18 +8,57 @@ import os
 import sys
 import json
 import argparse
+import asyncio
+import concurrent.futures
+import itertools
+import threading
+from pathlib import Path
 from web_scraper import WebScraper
 from termcolor import colored
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Constant colored() output, rendered once at import
+_TITLE = colored("Advanced Web Scraper and HTML Parser - Demo", "cyan", attrs=['bold'])
+_RULE = colored("=" * 50, "cyan")
+_HDR_HTML = colored("\n=== HTML FILE PARSING DEMO ===", "yellow", attrs=['bold'])
+_HDR_WEB = colored("\n=== WEB SCRAPING DEMO ===", "yellow", attrs=['bold'])
+_HDR_MIRROR = colored("\n=== WEBSITE MIRROR DEMO ===", "yellow", attrs=['bold'])
+_HDR_USAGE = colored("\n=== WEB SCRAPER DEMO USAGE ===", "cyan", attrs=['bold'])
+_MSG_HTML_SAVED = colored("Results saved to demo_html_parse.json", "green")
+_MSG_HTML_EMPTY = colored("No results obtained from HTML parsing", "red")
+_MSG_NO_HTML_FILES = colored("No HTML files found in current directory", "yellow")
+_MSG_WEB_SAVED = colored("Results saved to demo_web_scrape.json", "green")
+_MSG_WEB_EMPTY = colored("No results obtained from web scraping", "red")
+_MSG_WEB_NETWORK = colored("This might be due to network connectivity issues", "yellow")
+_MSG_MIRROR_DONE = colored("\nWebsite mirroring completed successfully!", "green")
+_MSG_MIRROR_INTERRUPTED = colored("\nWebsite mirroring interrupted", "yellow")
+_MSG_MIRROR_NETWORK = colored("This might be due to network connectivity or the test site being unavailable.", "yellow")
+_MSG_DEMOS_INTERRUPTED = colored("\nDemos interrupted", "yellow")
+_MSG_SAMPLE_CREATED = colored("Sample HTML file 'sample_demo.html' created successfully!", "green")
+
+# Downloaded files listed by the mirror demo unless --verbose is given
+_MAX_LISTED_FILES = 50
+
+def _first_html():
+    """Return the name of the first .html file in the current directory, or None."""
+    with os.scandir('.') as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith('.html'):
+                return entry.name
+    return None
+
 def demo_html_parsing():
     """Demonstrate HTML file parsing capabilities."""
-    print(colored("\n=== HTML FILE PARSING DEMO ===", "yellow", attrs=['bold']))
+    print(_HDR_HTML)
     
     # Check if there are any HTML files in the current directory
-    html_files = [f for f in os.listdir('.') if f.endswith('.html')]
+    html_file = _first_html()
     
-    if html_files:
-        html_file = html_files[0]
+    if html_file is not None:
         print(f"Parsing HTML file: {html_file}")
         
         scraper = WebScraper(output_format='json')
@@ -30,16 +69,16 @@ def demo_html_parsing():
             
             # Save results
             scraper.save_results(results, f"demo_html_parse")
-            print(colored(f"Results saved to demo_html_parse.json", "green"))
+            print(_MSG_HTML_SAVED)
         else:
-            print(colored("No results obtained from HTML parsing", "red"))
+            print(_MSG_HTML_EMPTY)
     else:
-        print(colored("No HTML files found in current directory", "yellow"))
+        print(_MSG_NO_HTML_FILES)
         print("You can test with: python demo.py --create-sample")
 
 def demo_web_scraping():
     """Demonstrate web scraping capabilities."""
-    print(colored("\n=== WEB SCRAPING DEMO ===", "yellow", attrs=['bold']))
+    print(_HDR_WEB)
     
     # Use a simple, reliable test site
     test_url = "https://httpbin.org/html"
@@ -54,17 +93,62 @@ def demo_web_scraping():
             
             # Save results
             scraper.save_results(results, "demo_web_scrape")
-            print(colored(f"Results saved to demo_web_scrape.json", "green"))
+            print(_MSG_WEB_SAVED)
         else:
-            print(colored("No results obtained from web scraping", "red"))
+            print(_MSG_WEB_EMPTY)
             
     except Exception as e:
         print(colored(f"Error during web scraping: {str(e)}", "red"))
-        print(colored("This might be due to network connectivity issues", "yellow"))
+        print(_MSG_WEB_NETWORK)
 
-def demo_mirror_functionality():
-    """Demonstrate website mirroring functionality."""
-    print(colored("\n=== WEBSITE MIRROR DEMO ===", "yellow", attrs=['bold']))
+def _run_in_daemon_thread(func, *args):
+    """Call func(*args) in a daemon thread and return (thread, future).
+
+    The future receives func's result or exception. Daemon threads do not keep
+    the interpreter alive, so Ctrl-C ends the demo right away instead of
+    waiting for a blocking crawl to finish.
+    """
+    future = concurrent.futures.Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, future
+
+async def _iter_downloads(scraper, scrape_thread, poll_interval=0.1):
+    """Yield (url, local_path) pairs as the scraper records downloaded files.
+
+    Polls scraper.downloaded_files while scrape_thread is alive, then yields
+    any entries added after the last poll once the thread has finished. Assumes
+    the scraper only ever appends to the dict: entries are never removed or
+    reordered, so everything past the last seen position is new.
+    """
+    downloaded_files = getattr(scraper, 'downloaded_files', {})
+    seen = 0
+    while True:
+        finished = not scrape_thread.is_alive()
+        # Copy only the entries added since the last poll
+        new_items = list(itertools.islice(downloaded_files.items(), seen, None))
+        seen += len(new_items)
+        for item in new_items:
+            yield item
+        if finished:
+            return
+        await asyncio.sleep(poll_interval)
+
+async def demo_mirror_functionality_async(verbose=False):
+    """Demonstrate website mirroring, listing files while they download.
+
+    Only the first _MAX_LISTED_FILES downloads are listed unless verbose is set.
+    """
+    print(_HDR_MIRROR)
     
     # Use a simple test site for mirroring
     test_url = "https://httpbin.org/html"
@@ -83,24 +167,29 @@ def demo_mirror_functionality():
             mirror_dir=mirror_dir
         )
         
-        results = scraper.scrape_website(test_url)
+        # Run the blocking scrape in a worker thread and list files as they arrive
+        scrape_thread, scrape = _run_in_daemon_thread(scraper.scrape_website, test_url)
+        html_files, resource_files = [], []
+        async for url, local_path in _iter_downloads(scraper, scrape_thread):
+            if not html_files and not resource_files:
+                print("\nDownloaded files:")
+            (html_files if local_path.endswith('.html') else resource_files).append(local_path)
+            if verbose or len(html_files) + len(resource_files) <= _MAX_LISTED_FILES:
+                print(f"  {local_path} <- {url}")
+        
+        hidden = len(html_files) + len(resource_files) - _MAX_LISTED_FILES
+        if not verbose and hidden > 0:
+            print(f"  ... and {hidden} more (use --verbose to list all)")
         
-        print(colored("\nWebsite mirroring completed successfully!", "green"))
+        results = scrape.result()
+        
+        print(_MSG_MIRROR_DONE)
         
         if hasattr(scraper, 'downloaded_files'):
-            html_files = [f for f in scraper.downloaded_files.values() if f.endswith('.html')]
-            resource_files = [f for f in scraper.downloaded_files.values() if not f.endswith('.html')]
-            
             print(f"Pages mirrored: {len(html_files)}")
             print(f"Resources downloaded: {len(resource_files)}")
             print(f"Mirror directory: {scraper.mirror_dir}")
             
-            # List downloaded files
-            if scraper.downloaded_files:
-                print("\nDownloaded files:")
-                for url, local_path in scraper.downloaded_files.items():
-                    print(f"  {local_path} <- {url}")
-            
             # Check if mirror index was created
             index_path = os.path.join(scraper.mirror_dir, 'mirror_index.html')
             if os.path.exists(index_path):
@@ -109,25 +198,33 @@ def demo_mirror_functionality():
         
         # Also save the scraping results
         output_file = "demo_mirror_results.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Convert sets to lists for JSON serialization
-            json_results = {}
-            for key, value in results.items():
-                if isinstance(value, set):
-                    json_results[key] = list(value)
-                else:
-                    json_results[key] = value
-            json.dump(json_results, f, indent=2, ensure_ascii=False)
+        # Sets are serialized as lists via the default hook
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    default=list,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False, default=list)
         
         print(colored(f"Scraping results also saved to: {output_file}", "green"))
         
     except Exception as e:
         print(colored(f"Error during website mirroring: {str(e)}", "red"))
-        print(colored("This might be due to network connectivity or the test site being unavailable.", "yellow"))
+        print(_MSG_MIRROR_NETWORK)
 
-def create_sample_html():
-    """Create a sample HTML file for testing."""
-    sample_html = """
+def demo_mirror_functionality(verbose=False):
+    """Demonstrate website mirroring functionality."""
+    try:
+        asyncio.run(demo_mirror_functionality_async(verbose))
+    except KeyboardInterrupt:
+        print(_MSG_MIRROR_INTERRUPTED)
+
+# Sample page written by create_sample_html(), kept pre-encoded
+_SAMPLE_BYTES = b"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -189,21 +286,48 @@ def create_sample_html():
 </body>
 </html>
     """
+
+def create_sample_html():
+    """Create a sample HTML file for testing."""
+    Path('sample_demo.html').write_bytes(_SAMPLE_BYTES)
     
-    with open('sample_demo.html', 'w', encoding='utf-8') as f:
-        f.write(sample_html)
-    
-    print(colored("Sample HTML file 'sample_demo.html' created successfully!", "green"))
+    print(_MSG_SAMPLE_CREATED)
     print("You can now run: python demo.py --html to test HTML parsing")
 
+async def demo_all_async(verbose=False):
+    """Run the HTML, web and mirror demos concurrently.
+
+    WebScraper is blocking, so each demo runs its scraping in a daemon thread
+    and the network-bound demos overlap instead of running back to back. The
+    demos' output may interleave; a failure in one demo is reported once all
+    of them have finished instead of aborting the others. On Ctrl-C the run
+    stops at once: daemon threads are abandoned rather than joined, so
+    in-flight crawls do not hold up the exit.
+    """
+    names = ["HTML file parsing", "web scraping", "website mirroring"]
+    print(colored(f"\nRunning demos concurrently: {', '.join(names)}", "cyan"))
+    print("Output from the demos may interleave.")
+    
+    outcomes = await asyncio.gather(
+        asyncio.wrap_future(_run_in_daemon_thread(demo_html_parsing)[1]),
+        asyncio.wrap_future(_run_in_daemon_thread(demo_web_scraping)[1]),
+        demo_mirror_functionality_async(verbose),
+        return_exceptions=True
+    )
+    
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, Exception):
+            print(colored(f"Error during {name}: {str(outcome)}", "red"))
+
 def show_usage():
     """Show usage instructions."""
-    print(colored("\n=== WEB SCRAPER DEMO USAGE ===", "cyan", attrs=['bold']))
+    print(_HDR_USAGE)
     print("\nAvailable demo options:")
     print("  python demo.py --html          # Demo HTML file parsing")
     print("  python demo.py --web           # Demo web scraping")
     print("  python demo.py --mirror        # Demo website mirroring")
     print("  python demo.py --all           # Run all demos")
+    print("  python demo.py --verbose       # List every mirrored file (with --mirror/--all)")
     print("  python demo.py --create-sample # Create sample HTML file")
     print("  python demo.py --help          # Show this help")
     
@@ -214,8 +338,8 @@ def show_usage():
 
 def main():
     """Main demo function."""
-    print(colored("Advanced Web Scraper and HTML Parser - Demo", "cyan", attrs=['bold']))
-    print(colored("=" * 50, "cyan"))
+    print(_TITLE)
+    print(_RULE)
     
     parser = argparse.ArgumentParser(description="Web Scraper Demo - Test HTML parsing, web scraping, and mirror functionality")
     parser.add_argument('--create-sample', action='store_true', help='Create a sample HTML file for testing')
@@ -223,14 +347,16 @@ def main():
     parser.add_argument('--web', action='store_true', help='Test web scraping')
     parser.add_argument('--mirror', action='store_true', help='Test website mirroring functionality')
     parser.add_argument('--all', action='store_true', help='Run all demos')
+    parser.add_argument('--verbose', action='store_true', help='List every downloaded file in the mirror demo')
     
     args = parser.parse_args()
     
     if args.all:
         create_sample_html()
-        demo_html_parsing()
-        demo_web_scraping()
-        demo_mirror_functionality()
+        try:
+            asyncio.run(demo_all_async(args.verbose))
+        except KeyboardInterrupt:
+            print(_MSG_DEMOS_INTERRUPTED)
     elif args.create_sample:
         create_sample_html()
     elif args.html:
@@ -238,7 +364,7 @@ def main():
     elif args.web:
         demo_web_scraping()
     elif args.mirror:
-        demo_mirror_functionality()
+        demo_mirror_functionality(args.verbose)
     else:
         print("Please specify a demo option. Use --help for available options.")
 
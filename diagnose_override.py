@@ -9,80 +9,86 @@ from urllib.parse import urlparse
 
 def diagnose_override_issue(url, override_file):
     """Diagnose potential issues with index override functionality."""
-    print("🔍 Index Override Diagnostic Tool")
-    print("=" * 50)
+    lines = []
+    lines.append("🔍 Index Override Diagnostic Tool")
+    lines.append("=" * 50)
     
-    print(f"URL: {url}")
-    print(f"Override file: {override_file}")
-    print()
+    lines.append(f"URL: {url}")
+    lines.append(f"Override file: {override_file}")
+    lines.append("")
     
     # Check URL path
     parsed_url = urlparse(url)
-    print(f"Parsed URL components:")
-    print(f"  - Scheme: {parsed_url.scheme}")
-    print(f"  - Domain: {parsed_url.netloc}")
-    print(f"  - Path: '{parsed_url.path}'")
-    print()
+    lines.append(f"Parsed URL components:")
+    lines.append(f"  - Scheme: {parsed_url.scheme}")
+    lines.append(f"  - Domain: {parsed_url.netloc}")
+    lines.append(f"  - Path: '{parsed_url.path}'")
+    lines.append("")
     
     # Check if override should apply
-    is_root = parsed_url.path in ['/', '']
-    print(f"Is root URL? {is_root}")
+    is_root = parsed_url.path in ('', '/')
+    lines.append(f"Is root URL? {is_root}")
     if is_root:
-        print("✅ Override SHOULD be applied for this URL")
+        lines.append("✅ Override SHOULD be applied for this URL")
     else:
-        print("❌ Override will NOT be applied for this URL")
-        print("   Override only works for root URLs (path = '/' or '')")
-        print("   Examples of root URLs:")
-        print("   - https://example.com/")
-        print("   - https://example.com")
-        print("   Examples of non-root URLs:")
-        print("   - https://example.com/about")
-        print("   - https://example.com/page.html")
-    print()
+        lines.append("❌ Override will NOT be applied for this URL")
+        lines.append("   Override only works for root URLs (path = '/' or '')")
+        lines.append("   Examples of root URLs:")
+        lines.append("   - https://example.com/")
+        lines.append("   - https://example.com")
+        lines.append("   Examples of non-root URLs:")
+        lines.append("   - https://example.com/about")
+        lines.append("   - https://example.com/page.html")
+    lines.append("")
     
     # Check override file
-    print(f"Override file check:")
+    lines.append(f"Override file check:")
     if os.path.exists(override_file):
-        print(f"✅ Override file exists: {override_file}")
+        lines.append(f"✅ Override file exists: {override_file}")
         
-        # Check file size
-        file_size = os.path.getsize(override_file)
-        print(f"   File size: {file_size} bytes")
-        
-        if file_size == 0:
-            print("⚠️  WARNING: Override file is empty!")
-        
-        # Show first few lines
+        # Check file size and show the first bytes from a single descriptor
         try:
-            with open(override_file, 'r', encoding='utf-8') as f:
-                first_lines = f.read(200)
-                print(f"   First 200 characters:")
-                print(f"   {repr(first_lines)}")
-        except Exception as e:
-            print(f"❌ Error reading override file: {e}")
+            fd = os.open(override_file, os.O_RDONLY)
+            try:
+                file_size = os.fstat(fd).st_size
+                lines.append(f"   File size: {file_size} bytes")
+                
+                if file_size == 0:
+                    lines.append("⚠️  WARNING: Override file is empty!")
+                
+                first_bytes = os.read(fd, 200)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            lines.append(f"❌ Error reading override file {override_file}: {e}")
+        else:
+            lines.append(f"   First 200 bytes:")
+            lines.append(f"   {repr(first_bytes.decode('utf-8', 'replace'))}")
     else:
-        print(f"❌ Override file NOT found: {override_file}")
-        print("   Make sure the file path is correct and the file exists")
+        lines.append(f"❌ Override file NOT found: {override_file}")
+        lines.append("   Make sure the file path is correct and the file exists")
         
         # Check if it's a relative path issue
         if not os.path.isabs(override_file):
             abs_path = os.path.abspath(override_file)
-            print(f"   Absolute path would be: {abs_path}")
+            lines.append(f"   Absolute path would be: {abs_path}")
             if os.path.exists(abs_path):
-                print(f"   ✅ File exists at absolute path!")
+                lines.append(f"   ✅ File exists at absolute path!")
             else:
-                print(f"   ❌ File doesn't exist at absolute path either")
+                lines.append(f"   ❌ File doesn't exist at absolute path either")
     
-    print()
-    print("🔧 Troubleshooting Tips:")
-    print("1. Make sure you're using a root URL (ending with / or no path)")
-    print("2. Verify the override file exists and has content")
-    print("3. Use absolute paths for the override file if having issues")
-    print("4. Check that --mirror mode is enabled")
-    print("5. Look for 'Saved HTML with override' in the log output")
-    print()
-    print("Example working command:")
-    print("python web_scraper.py -u https://example.com/ --mirror --index-override custom_index.html")
+    lines.append("")
+    lines.append("🔧 Troubleshooting Tips:")
+    lines.append("1. Make sure you're using a root URL (ending with / or no path)")
+    lines.append("2. Verify the override file exists and has content")
+    lines.append("3. Use absolute paths for the override file if having issues")
+    lines.append("4. Check that --mirror mode is enabled")
+    lines.append("5. Look for 'Saved HTML with override' in the log output")
+    lines.append("")
+    lines.append("Example working command:")
+    lines.append("python web_scraper.py -u https://example.com/ --mirror --index-override custom_index.html")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def main():
     if len(sys.argv) != 3:
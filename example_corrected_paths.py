@@ -9,9 +9,8 @@ import os
 import tempfile
 from web_scraper import WebScraper
 
-def create_corrected_index():
-    """Create an index file with corrected JavaScript paths."""
-    corrected_content = """
+# Override page written by create_corrected_index(), encoded once at import
+_CORRECTED_HTML_BYTES = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -69,11 +68,16 @@ def create_corrected_index():
     </script>
 </body>
 </html>
-"""
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='_corrected.html', delete=False, encoding='utf-8') as f:
-        f.write(corrected_content)
-        return f.name
+""".encode('utf-8')
+
+def create_corrected_index():
+    """Create an index file with corrected JavaScript paths."""
+    fd, path = tempfile.mkstemp(suffix='_corrected.html')
+    try:
+        os.write(fd, _CORRECTED_HTML_BYTES)
+    finally:
+        os.close(fd)
+    return path
 
 def demonstrate_corrected_paths():
     """Demonstrate using override to fix broken JavaScript paths."""
@@ -138,11 +142,12 @@ def demonstrate_corrected_paths():
         print("\n🔍 VERIFICATION:")
         print("-" * 20)
         
-        all_resources = css_files + js_files + images
+        # Substring search over one newline-joined blob instead of every resource
+        resource_blob = '\n'.join(css_files + js_files + images)
         found_corrected = 0
         
         for path in corrected_paths:
-            found = any(path in resource for resource in all_resources)
+            found = path in resource_blob
             status = "✅" if found else "❌"
             print(f"  {status} {path}")
             if found: